@@ -9,9 +9,13 @@ from .base import DeviceError
 
 import time
 import re
+import array
+import asyncio
 import contextlib
+import threading
 import warnings
 import functools
+import concurrent.futures
 
 
 ### Generic backend interface ###
@@ -74,10 +78,17 @@ class IDeviceCommBackend:
     def __init__(self, conn, timeout=None, term_write=None, term_read=None, datatype="auto", reraise_error=None):  # pylint: disable=unused-argument
         funcargparse.check_parameter_range(datatype,"datatype",{"auto","str","bytes"})
         self.datatype=datatype
+        self._datatype_conv=None if datatype=="auto" else (py3.as_str if datatype=="str" else py3.as_bytes)
         self.conn=conn
-        self.term_write=term_write
-        self.term_read=term_read
+        self.set_term_write(term_write)
+        self.set_term_read(term_read)
         self._operation_cooldown=dict(self._default_operation_cooldown)
+        self._any_cooldown=any(v>0 for v in self._operation_cooldown.values())
+        self._cooldown_deadline=0.
+        self._threadlock=threading.RLock()
+        self._background_echo=False
+        self._echo_executor=None
+        self._echo_future=None
         if reraise_error is not None:
             self.Error=reraise_error
 
@@ -102,12 +113,36 @@ class IDeviceCommBackend:
         """Get string representation of the backend (e.g., ``"serial"``, ``"visa"``, or ``"network"``)"""
         return getattr(cls,"_backend",None)
 
+    def set_term_write(self, term_write):
+        """Set the write terminator and precompute its bytes representation"""
+        self.term_write=term_write
+        self._term_write_bytes=py3.as_builtin_bytes(term_write) if term_write else b""
+    def set_term_read(self, term_read):
+        """Set the read terminator (a string, a list of strings, or ``None``) and precompute its bytes representation"""
+        self.term_read=term_read
+        if term_read is None:
+            terms=[]
+        elif isinstance(term_read,py3.anystring):
+            terms=[term_read]
+        else:
+            terms=list(term_read)
+        self._term_read_sorted=tuple(sorted((py3.as_builtin_bytes(t) for t in terms if t),key=len,reverse=True))
+        if self._term_read_sorted:
+            # tail-anchored pattern, so stripping is a single scan of the last few bytes; the leftmost match ending at the end is automatically the longest
+            self._term_strip_re=re.compile(b"(?:"+b"|".join(re.escape(t) for t in self._term_read_sorted)+b")$")
+            self._term_strip_maxlen=max(len(t) for t in self._term_read_sorted)
+        else:
+            self._term_strip_re=None
+            self._term_strip_maxlen=0
+    def _remove_read_term(self, msg):
+        """Remove the longest read terminator from the end of the message"""
+        if self._term_strip_re is None:
+            return msg
+        m=self._term_strip_re.search(msg,max(len(msg)-self._term_strip_maxlen,0))
+        return msg[:m.start()] if m is not None else msg
+
     def _to_datatype(self, data):
-        if self.datatype=="auto":
-            return data
-        if self.datatype=="str":
-            return py3.as_str(data)
-        return py3.as_bytes(data)
+        return data if self._datatype_conv is None else self._datatype_conv(data)
     
     def open(self):
         """Open the connection"""
@@ -128,15 +163,20 @@ class IDeviceCommBackend:
             logger.log(operation,value)
     
     def lock(self, timeout=None):
-        """Lock the access to the device from other threads/processes (isn't necessarily implemented)"""
-        pass
+        """Lock the access to the device from other threads (inter-process locking isn't necessarily implemented)"""
+        return self._threadlock.acquire(timeout=-1 if timeout is None else timeout)
     def unlock(self):
-        """Unlock the access to the device from other threads/processes (isn't necessarily implemented)"""
-        pass
+        """Unlock the access to the device from other threads (inter-process locking isn't necessarily implemented)"""
+        self._threadlock.release()
     @contextlib.contextmanager
-    def locking(self, timeout=None):  # pylint: disable=unused-argument
+    def locking(self, timeout=None):
         """Context manager for lock & unlock"""
-        yield
+        if not self.lock(timeout=timeout):
+            raise self.Error("could not acquire lock in {} seconds".format(timeout))
+        try:
+            yield
+        finally:
+            self.unlock()
     
     def setup_cooldown(self, **kwargs):
         """
@@ -151,17 +191,24 @@ class IDeviceCommBackend:
         if "all" in kwargs:
             self._operation_cooldown={"default":kwargs.pop("all")}
         self._operation_cooldown.update(kwargs)
+        self._any_cooldown=any(v>0 for v in self._operation_cooldown.values())
     def cooldown(self, kind="default"):
         """
         Cooldown between the operations.
-        
+
         ``kind`` specifies the operation kind (common kinds are ``open``, ``close``, ``read``, ``write``, ``timeout``, and ``flush``);
         ``"default"`` corresponds to the default cooldown (usually, specified as 0).
         Called automatically by various backend operations, so usually there is no need to call explicitly.
         """
+        if not self._any_cooldown: # fast path for the default all-zero setup
+            return
         cooldown=self._operation_cooldown.get(kind,self._operation_cooldown.get("default",0))
         if cooldown>0:
-            time.sleep(cooldown)
+            deadline=max(time.monotonic()+cooldown,self._cooldown_deadline)
+            self._cooldown_deadline=deadline
+            wait=deadline-time.monotonic()
+            if wait>0:
+                time.sleep(wait)
     
     def set_timeout(self, timeout):
         """Set operations timeout (in seconds)"""
@@ -170,18 +217,21 @@ class IDeviceCommBackend:
         """Get operations timeout (in seconds)"""
         return None
     
-    @contextlib.contextmanager
     def using_timeout(self, timeout=None):
         """Context manager for usage of a different timeout inside a block"""
-        if timeout is not None:
-            to=self.get_timeout()  # pylint: disable=assignment-from-none
-            if to!=timeout:
-                self.set_timeout(timeout)
+        if timeout is None:
+            return general.DummyResource()
+        to=self.get_timeout()  # pylint: disable=assignment-from-none
+        if to==timeout:
+            return general.DummyResource()
+        return self._changed_timeout(timeout,to)
+    @contextlib.contextmanager
+    def _changed_timeout(self, timeout, restore_timeout):
+        self.set_timeout(timeout)
         try:
             yield
         finally:
-            if timeout is not None and to!=timeout:
-                self.set_timeout(to)
+            self.set_timeout(restore_timeout)
     
             
         
@@ -198,10 +248,25 @@ class IDeviceCommBackend:
     def readlines(self, lines_num, remove_term=True, timeout=None, skip_empty=True):
         """
         Read multiple lines from the device.
-        
+
         Parameters are the same as in :func:`readline`.
         """
         return [self.readline(remove_term=remove_term,timeout=timeout,skip_empty=skip_empty) for _ in range(lines_num)]
+    def readline_into(self, buffer, size=None, remove_term=True, timeout=None, skip_empty=True):
+        """
+        Read a single line from the device and store it into the supplied writable buffer (e.g., a ``bytearray`` or a ``memoryview``).
+
+        `size` limits the stored length (buffer length by default); if the received line is longer, raise ``ValueError``.
+        Other parameters are the same as in :meth:`readline`. Return the number of bytes stored.
+        The generic implementation goes through :meth:`readline`; backends can override it to avoid intermediate copies.
+        """
+        if size is None:
+            size=len(buffer)
+        data=py3.as_builtin_bytes(self.readline(remove_term=remove_term,timeout=timeout,skip_empty=skip_empty))
+        if len(data)>size:
+            raise ValueError("line length {} exceeds the buffer size {}".format(len(data),size))
+        buffer[:len(data)]=data
+        return len(data)
     def read(self, size=None):
         """
         Read data from the device.
@@ -209,6 +274,18 @@ class IDeviceCommBackend:
         If `size` is not None, read `size` bytes (the standard timeout applies); otherwise, read all available data (return immediately).
         """
         raise NotImplementedError("IDeviceCommBackend.read")
+    def read_into(self, buffer, size=None):
+        """
+        Read data from the device into the supplied writable buffer (e.g., a ``bytearray`` or a ``memoryview``).
+
+        If `size` is ``None``, use the buffer length. Return the number of bytes read.
+        The generic implementation goes through :meth:`read`; backends can override it to avoid the intermediate copy.
+        """
+        if size is None:
+            size=len(buffer)
+        data=py3.as_builtin_bytes(self.read(size))
+        buffer[:len(data)]=data
+        return len(data)
     def flush_read(self):
         """Flush the device output (read all the available data; return the number of bytes read)"""
         return len(self.read())
@@ -220,6 +297,33 @@ class IDeviceCommBackend:
         If ``read_echo==True``, wait for `read_echo_delay` seconds and then perform :func:`readline` (`read_echo_lines` times).
         """
         raise NotImplementedError("IDeviceCommBackend.write")
+    def enable_background_echo(self, enable=True):
+        """
+        Enable or disable background echo collection.
+
+        When enabled, echo lines requested via ``write(..., read_echo=True)`` are read on a background thread
+        instead of blocking the writing call; :meth:`flush_echo` waits until all pending echo lines have been read.
+        Since the echo reads share the connection, no other read operations should be performed while an echo is pending.
+        """
+        if enable and self._echo_executor is None:
+            self._echo_executor=concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._background_echo=enable
+    def flush_echo(self, timeout=None):
+        """Wait until all echo lines submitted for background collection have been read"""
+        if self._echo_future is not None:
+            self._echo_future.result(timeout=timeout)
+            self._echo_future=None
+    def _read_echo(self, read_echo_delay, read_echo_lines):
+        """Read `read_echo_lines` echo lines after a write (on the background echo thread, if enabled)"""
+        def _collect():
+            if read_echo_delay>0.:
+                time.sleep(read_echo_delay)
+            for _ in range(read_echo_lines):
+                self.readline()
+        if self._background_echo:
+            self._echo_future=self._echo_executor.submit(_collect)
+        else:
+            _collect()
     def ask(self, query, delay=0., read_all=False):
         """
         Perform a write followed by a read, with `delay` in between.
@@ -255,9 +359,46 @@ def remove_longest_term(msg, terms):
     """
     tcs=0
     for t in terms:
-        if msg.endswith(py3.as_builtin_bytes(t)):
-            tcs=max(tcs,len(t))
-    return msg[:-tcs]
+        t=py3.as_builtin_bytes(t)
+        if len(t)>tcs and msg.endswith(t):
+            tcs=len(t)
+    return msg[:-tcs] if tcs else msg
+
+@functools.lru_cache(maxsize=128)
+def _compile_terms(terms):
+    """
+    Convert a terminator tuple into bytes and precompile a matching regex.
+
+    Return tuple ``(terms_bytes, pattern, maxlen, single)``, where `pattern` is a compiled regex matching any of the terminators
+    (shortest-first, so the earliest-ending match is found, same as a per-byte scan), `maxlen` is the longest terminator length,
+    and `single` is the terminator bytes for a single-terminator set (``None`` otherwise), which allows for a faster ``find``-based scan.
+    The result is memoized module-wide (terminator sets are few), so backend instances do not grow their own caches.
+    """
+    terms_bytes=tuple(py3.as_builtin_bytes(t) for t in terms)
+    pattern=re.compile(b"|".join(re.escape(t) for t in sorted(terms_bytes,key=len)))
+    maxlen=max(len(t) for t in terms_bytes)
+    single=terms_bytes[0] if len(terms_bytes)==1 else None
+    return (terms_bytes,pattern,maxlen,single)
+
+def _scan_terms(buf, spos, scanner):
+    """
+    Find the earliest terminator match in `buf` starting at position `spos` using a scanner tuple built by :func:`_compile_terms`.
+
+    Return the position right after the match, or -1 if no terminator is found.
+    """
+    terms_bytes,pattern,maxlen,single=scanner
+    if single is not None: # single terminator allows for a faster find-based scan
+        i=buf.find(single,spos)
+        return i+len(single) if i>=0 else -1
+    if maxlen==1: # several single-character terminators: a find per terminator beats the regex engine on typical line lengths
+        end=-1
+        for t in terms_bytes:
+            i=buf.find(t,spos)
+            if i>=0 and (i<end or end<0):
+                end=i
+        return end+1 if end>=0 else -1
+    m=pattern.search(buf,spos)
+    return m.end() if m is not None else -1
     
 
 
@@ -312,7 +453,8 @@ try:
                     raise NotImplementedError("PyVisa version <1.6 doesn't support different terminators for reading and writing; update to a newer version by running 'pip install --upgrade pyvisa'")
                 instr=visa.instrument(conn) # pylint: disable=no-member
                 instr.term_chars=self.term_read
-                self.term_write=self.term_write[:len(self.term_write)-len(self.term_read)]
+                self.set_term_write(self.term_write[:len(self.term_write)-len(self.term_read)])
+                self._term_read_bytes=py3.as_builtin_bytes(instr.term_chars)
                 return instr
             _lock_default=False
             def _lock(self, timeout=None):
@@ -321,9 +463,8 @@ try:
                 raise NotImplementedError("PyVisa version <1.6 doesn't support locking; update to a newer version by running 'pip install --upgrade pyvisa'")
             def _lock_context(self, timeout=None):
                 raise NotImplementedError("PyVisa version <1.6 doesn't support locking; update to a newer version by running 'pip install --upgrade pyvisa'")
-            @reraise
             def _read_term(self):
-                return py3.as_builtin_bytes(self.instr.term_chars)
+                return self._term_read_bytes
         else:
             @reraise
             def _set_timeout(self, timeout):
@@ -336,7 +477,9 @@ try:
                 instr=visa.ResourceManager().open_resource(conn)
                 instr.read_termination=self.term_read
                 instr.write_termination=self.term_write
-                self.term_read=self.term_write=""
+                self.set_term_read("")
+                self.set_term_write("")
+                self._term_read_bytes=py3.as_builtin_bytes(instr.read_termination or b"")
                 return instr
             _lock_default=False
             @reraise
@@ -348,9 +491,8 @@ try:
             @reraise
             def _lock_context(self, timeout=None):
                 return self.instr.lock_context(timeout=timeout*1000. if timeout is not None else None)
-            @reraise
             def _read_term(self):
-                return py3.as_builtin_bytes(self.instr.read_termination)
+                return self._term_read_bytes
             @staticmethod
             def list_resources(desc=False):
                 try:
@@ -361,28 +503,29 @@ try:
             @reraise
             def _read_raw(self, size):
                 chunk_size=self.instr.chunk_size
-                data=bytearray()
+                buffer=bytearray(size) # preallocate the whole result and fill it in-place, so the chunks are only copied once
+                lread=0
                 with self.instr.ignore_warning(visa.constants.VI_SUCCESS_DEV_NPRESENT,visa.constants.VI_SUCCESS_MAX_CNT):
-                    while len(data)<size:
-                        to_read=min(chunk_size,size-len(data))
+                    while lread<size:
+                        to_read=min(chunk_size,size-lread)
                         chunk,_=self.instr.visalib.read(self.instr.session,to_read)
-                        data.extend(chunk)
-                return bytes(data)
+                        buffer[lread:lread+len(chunk)]=chunk
+                        lread+=len(chunk)
+                return bytes(buffer)
         else:
             @reraise
             def _read_raw(self, size):
                 return self.instr.read_bytes(size)
         @reraise
         def _read_all(self):
-            data=bytearray()
+            chunks=[] # collect chunks and join once at the end, so each chunk is only copied once
             with self.using_timeout(0):
                 while True:
                     try:
-                        chunk=self.instr.read_raw()
-                        data.extend(chunk)
+                        chunks.append(self.instr.read_raw())
                     except visa.VisaIOError as err:
                         if err.abbreviation=="VI_ERROR_TMO":
-                            return bytes(data)
+                            return b"".join(chunks)
                         else:
                             raise
         
@@ -393,6 +536,7 @@ try:
                 term_read=b"\n"
             super().__init__(conn,term_write=term_write,term_read=term_read,datatype=datatype,reraise_error=reraise_error)
             self.instr=None
+            self._current_timeout=None
             try:
                 self.instr=self._open_resource(self.conn)
                 self.opened=True
@@ -420,11 +564,11 @@ try:
         def lock(self, timeout=None):
             """Lock the access to the device from other threads/processes"""
             if self._do_lock:
-                self.lock(timeout=timeout)
+                self._lock(timeout=timeout)
         def unlock(self):
             """Unlock the access to the device from other threads/processes"""
             if self._do_lock:
-                self.unlock()
+                self._unlock()
         def locking(self, timeout=None):
             """Context manager for lock & unlock"""
             if self._do_lock:
@@ -434,12 +578,15 @@ try:
         
         def set_timeout(self, timeout):
             """Set operations timeout (in seconds)"""
-            if timeout is not None:
+            if timeout is not None and timeout!=self._current_timeout:
                 self._set_timeout(timeout)
+                self._current_timeout=timeout
                 self.cooldown("timeout")
         def get_timeout(self):
             """Get operations timeout (in seconds)"""
-            return self._get_timeout()
+            if self._current_timeout is None:
+                self._current_timeout=self._get_timeout()
+            return self._current_timeout
         
         @logerror
         @reraise
@@ -487,15 +634,14 @@ try:
             """
             self._log("write",data)
             data=py3.as_builtin_bytes(data)
-            if self.term_write:
-                data=data+py3.as_builtin_bytes(self.term_write)
+            if self._term_write_bytes:
+                data=data+self._term_write_bytes
             self.instr.write_raw(data)
             self.cooldown("write")
-            if read_echo_delay>0.:
-                time.sleep(read_echo_delay)
             if read_echo:
-                for _ in range(read_echo_lines):
-                    self.readline()
+                self._read_echo(read_echo_delay,read_echo_lines)
+            elif read_echo_delay>0.:
+                time.sleep(read_echo_delay)
 
         @reraise
         def __repr__(self):
@@ -549,6 +695,7 @@ try:
         
         _conn_params=["port","baudrate","bytesize","parity","stopbits","xonxoff","rtscts","dsrdtr"]
         _default_conn=["COM1",19200,8,"N",1,0,0,0]
+        _split_write_size=1<<16 # payloads above this size are written separately from the terminator to avoid copying them on concatenation
 
         def __init__(self, conn, timeout=10., term_write=None, term_read=None, connect_on_operation=False, open_retry_times=3, no_dtrrts=False, datatype="auto", reraise_error=None):
             conn_dict=self.combine_conn(conn,self._default_conn)
@@ -561,8 +708,11 @@ try:
             super().__init__(conn_dict.copy(),term_write=term_write,term_read=term_read,datatype=datatype,reraise_error=reraise_error)
             port=conn_dict.pop("port")
             self.instr=None
+            self._rxbuf=bytearray()
+            self._current_timeout=None
             try:
                 self.instr=serial.serial_for_url(port,do_not_open=True,**conn_dict)
+                self._needs_flush=isinstance(self.instr,serial.Serial) # flush only drains a real OS write buffer; for wrapped urls (loop, rfc2217, etc.) it is a no-op call
                 self.opened=True
                 if no_dtrrts:
                     try:
@@ -625,35 +775,65 @@ try:
         @reraise
         def set_timeout(self, timeout):
             """Set operations timeout (in seconds)"""
-            if timeout is not None:
+            if timeout is not None and timeout!=self._current_timeout:
                 self.instr.timeout=timeout
+                self._current_timeout=timeout
                 self.cooldown("timeout")
         @reraise
         def get_timeout(self):
             """Get operations timeout (in seconds)"""
-            return self.instr.timeout
-        
+            if self._current_timeout is None:
+                self._current_timeout=self.instr.timeout
+            return self._current_timeout
+
+        def _compile_terms(self, terms):
+            """Get the precompiled terminator scanner tuple (see :func:`_compile_terms`)"""
+            return _compile_terms(tuple(terms))
+        def _skip_leading_terms(self):
+            """Drop leading read terminators from the read buffer, so skipping empty lines does not require a separate read cycle per line"""
+            rxbuf=self._rxbuf
+            pos=0
+            n=len(rxbuf)
+            while pos<n:
+                for t in self._term_read_sorted:
+                    if rxbuf.startswith(t,pos):
+                        pos+=len(t)
+                        break
+                else:
+                    break
+            if pos:
+                del rxbuf[:pos]
         @reraise
         def _read_terms(self, terms=(), read_block_size=8, timeout=None, error_on_timeout=True):
-            result=b""
-            singlechar_terms=all(len(t)==1 for t in terms)
-            terms=[py3.as_builtin_bytes(t) for t in terms]
-            with self.single_op():
-                with self.using_timeout(timeout):
+            # the caller is responsible for wrapping the call into single_op, so that repeated reads do not re-enter the context manager
+            rxbuf=self._rxbuf
+            with self.using_timeout(timeout):
+                if not terms: # read everything until the timeout, accumulating directly into the persistent buffer
                     while True:
-                        c=self.instr.read(1 if terms else read_block_size)
-                        result=result+c
+                        c=self.instr.read(max(self.instr.in_waiting,read_block_size))
                         if c==b"":
-                            if error_on_timeout and terms:
-                                raise self.Error("timeout during read")
+                            result=bytes(rxbuf)
+                            del rxbuf[:]
                             return result
-                        if singlechar_terms:
-                            if c in terms:
-                                return result
-                        else:
-                            for t in terms:
-                                if result.endswith(t):
-                                    return result
+                        rxbuf.extend(c)
+                scanner=self._compile_terms(terms)
+                maxlen=scanner[2]
+                spos=0 # rolling scan position, so the already-scanned part of the buffer is not re-examined
+                while True: # bulk-read into the buffer and scan for terminators, keeping the leftover for the next call
+                    end=_scan_terms(rxbuf,spos,scanner)
+                    if end>=0:
+                        result=bytes(rxbuf[:end])
+                        del rxbuf[:end]
+                        return result
+                    spos=max(len(rxbuf)-maxlen+1,0)
+                    c=self.instr.read(self.instr.in_waiting or 1)
+                    if c==b"":
+                        if error_on_timeout:
+                            raise self.Error("timeout during read")
+                        result=bytes(rxbuf)
+                        del rxbuf[:]
+                        return result
+                    rxbuf.extend(c)
         @logerror
         def readline(self, remove_term=True, timeout=None, skip_empty=True, error_on_timeout=True):  # pylint: disable=arguments-differ
             """
@@ -665,34 +845,128 @@ try:
                 skip_empty (bool): If ``True``, ignore empty lines (works only for ``remove_term==True``).
                 error_on_timeout (bool): If ``False``, return an incomplete line instead of raising the error on timeout.
             """
-            while True:
-                result=self._read_terms(self.term_read or [],timeout=timeout,error_on_timeout=error_on_timeout)
+            with self.single_op():
+                if skip_empty and remove_term and self.term_read:
+                    self._skip_leading_terms()
+                while True:
+                    result=self._read_terms(self.term_read or [],timeout=timeout,error_on_timeout=error_on_timeout)
+                    if remove_term and self.term_read:
+                        result=self._remove_read_term(result)
+                    if not (skip_empty and remove_term and (not result)):
+                        break
                 self.cooldown("read")
-                if remove_term and self.term_read:
-                    result=remove_longest_term(result,self.term_read)
-                if not (skip_empty and remove_term and (not result)):
-                    break
             self._log("read",result)
             return self._to_datatype(result)
         @logerror
+        def readlines(self, lines_num, remove_term=True, timeout=None, skip_empty=True, error_on_timeout=True):  # pylint: disable=arguments-differ
+            """
+            Read multiple lines from the device.
+
+            Parameters are the same as in :func:`readline`.
+            """
+            lines=[]
+            with self.single_op():
+                while len(lines)<lines_num:
+                    result=self._read_terms(self.term_read or [],timeout=timeout,error_on_timeout=error_on_timeout)
+                    if remove_term and self.term_read:
+                        result=self._remove_read_term(result)
+                    if skip_empty and remove_term and not result:
+                        continue
+                    self._log("read",result)
+                    lines.append(self._to_datatype(result))
+            self.cooldown("read")
+            return lines
+        @logerror
+        def readline_into(self, buffer, size=None, remove_term=True, timeout=None, skip_empty=True, error_on_timeout=True):  # pylint: disable=arguments-differ
+            """
+            Read a single line from the device and store it into the supplied writable buffer (e.g., a ``bytearray`` or a ``memoryview``).
+
+            `size` limits the stored length (buffer length by default); if the received line is longer, raise ``ValueError``;
+            in this case the line (including its terminator) is pushed back into the receive buffer, so it can still be obtained through :meth:`readline`.
+            Other parameters are the same as in :meth:`readline`. Return the number of bytes stored.
+            Unlike the generic implementation, the line is stored as raw bytes without the datatype conversion.
+            """
+            if size is None:
+                size=len(buffer)
+            with self.single_op():
+                if skip_empty and remove_term and self.term_read:
+                    self._skip_leading_terms()
+                while True:
+                    raw=self._read_terms(self.term_read or [],timeout=timeout,error_on_timeout=error_on_timeout)
+                    result=raw
+                    if remove_term and self.term_read:
+                        result=self._remove_read_term(raw)
+                    if not (skip_empty and remove_term and (not result)):
+                        break
+                self.cooldown("read")
+            if len(result)>size:
+                self._rxbuf[:0]=raw # push the consumed line back, so an oversized reply is not lost on the overflow error
+                raise ValueError("line length {} exceeds the buffer size {}".format(len(result),size))
+            self._log("read",result)
+            buffer[:len(result)]=result
+            return len(result)
+        @logerror
         @reraise
         def read(self, size=None):
             """
             Read data from the device.
-            
+
             If `size` is not None, read `size` bytes (usual timeout applies); otherwise, read all available data (return immediately).
             """
             with self.single_op():
                 if size is None:
                     result=self._read_terms(timeout=0,error_on_timeout=False)
                 else:
-                    result=self.instr.read(size=size)
+                    result=bytes(self._rxbuf[:size])
+                    del self._rxbuf[:size]
+                    if len(result)<size:
+                        n=size-len(result)
+                        avail=self.instr.in_waiting
+                        c=self.instr.read(size=max(avail,n)) # if more data is already pending, prefetch it in the same syscall
+                        if len(c)>n:
+                            self._rxbuf.extend(c[n:])
+                            c=c[:n]
+                        result=result+c
                     if len(result)!=size:
                         raise self.Error("read returned less than expected: {} instead of {}".format(len(result),size))
                 self.cooldown("read")
                 self._log("read",result)
                 return self._to_datatype(result)
         @logerror
+        @reraise
+        def read_into(self, buffer, size=None):
+            """
+            Read data from the device into the supplied writable buffer (e.g., a ``bytearray`` or a ``memoryview``).
+
+            If `size` is ``None``, use the buffer length. Return the number of bytes read.
+            Reads directly into the destination, avoiding the intermediate bytes object of :meth:`read`.
+            """
+            if size is None:
+                size=len(buffer)
+            with self.single_op():
+                pos=min(len(self._rxbuf),size) # serve the buffered leftover first
+                if pos:
+                    buffer[:pos]=self._rxbuf[:pos]
+                    del self._rxbuf[:pos]
+                readinto=getattr(self.instr,"readinto",None)
+                while pos<size:
+                    if readinto is not None:
+                        n=readinto(memoryview(buffer)[pos:size])
+                        if not n:
+                            break
+                        pos+=n
+                    else:
+                        c=self.instr.read(size-pos)
+                        if not c:
+                            break
+                        buffer[pos:pos+len(c)]=c
+                        pos+=len(c)
+                if pos!=size:
+                    raise self.Error("read returned less than expected: {} instead of {}".format(pos,size))
+                self.cooldown("read")
+                self._log("read",bytes(buffer[:size]))
+                return size
+        @logerror
         def read_multichar_term(self, term, remove_term=True, timeout=None, error_on_timeout=True):
             """
             Read a single line with multiple possible terminators.
@@ -705,7 +979,8 @@ try:
             """
             if isinstance(term,py3.anystring):
                 term=[term]
-            result=self._read_terms(term,timeout=timeout,error_on_timeout=error_on_timeout)
+            with self.single_op():
+                result=self._read_terms(term,timeout=timeout,error_on_timeout=error_on_timeout)
             self.cooldown("read")
             if remove_term and term:
                 result=remove_longest_term(result,term)
@@ -716,25 +991,29 @@ try:
         def write(self, data, flush=True, read_echo=False, read_echo_delay=0, read_echo_lines=1):
             """
             Write data to the device.
-            
+
             If ``flush==True``, flush the write buffer.
             If ``read_echo==True``, wait for `read_echo_delay` seconds and then perform :func:`readline` (`read_echo_lines` times).
             """
             self._log("write",data)
             with self.single_op():
                 data=py3.as_builtin_bytes(data)
-                if self.term_write:
-                    data=data+py3.as_builtin_bytes(self.term_write)
-                self.instr.write(data)
+                if self._term_write_bytes:
+                    if len(data)<self._split_write_size: # keep small writes in a single call
+                        self.instr.write(data+self._term_write_bytes)
+                    else: # serial connection is a byte stream, so terminator can be sent separately
+                        self.instr.write(data)
+                        self.instr.write(self._term_write_bytes)
+                else:
+                    self.instr.write(data)
                 self.cooldown("write")
-                if flush:
+                if flush and self._needs_flush:
                     self.instr.flush()
                     self.cooldown("flush")
-                if read_echo_delay>0.:
-                    time.sleep(read_echo_delay)
                 if read_echo:
-                    for _ in range(read_echo_lines):
-                        self.readline()
+                    self._read_echo(read_echo_delay,read_echo_lines)
+                elif read_echo_delay>0.:
+                    time.sleep(read_echo_delay)
 
         @reraise
         def __repr__(self):
@@ -805,6 +1084,8 @@ try:
             port=conn_dict.pop("port")
             self.opened=False
             self.instr=None
+            self._rxbuf=bytearray()
+            self._repr_cached=None
             try:
                 self.instr=self._open_instr(port,conn_dict)
                 self.opened=True
@@ -829,6 +1110,7 @@ try:
                 self.instr=self._open_instr(self._conn_params[0],self._conn_params[1])
                 self.set_timeout(self._conn_params[2])
                 self.opened=True
+                self._repr_cached=None
             general.retry_wait(reopen, self._open_retry_times, 0.3)
         @reraise
         def _do_close(self):
@@ -843,16 +1125,15 @@ try:
             self._do_close()
         def is_opened(self):
             return self.opened
-        @contextlib.contextmanager
+        _single_op_dummy=general.DummyResource()
         def single_op(self):
             """
             Context manager for a single operation.
-            
+
             Does nothing.
             """
-            yield
-            
-        
+            return self._single_op_dummy
+
         @reraise
         def set_timeout(self, timeout):
             """Set operations timeout (in seconds)"""
@@ -867,27 +1148,46 @@ try:
             return self.instr.timeout
         
         
+        def _compile_terms(self, terms):
+            """Get the precompiled terminator scanner tuple (see :func:`_compile_terms`)"""
+            return _compile_terms(tuple(terms))
+        def _pending(self):
+            """Get the number of bytes in the incoming buffer (0 if the driver does not report it)"""
+            n=getattr(self.instr,"in_waiting",None)
+            if n is not None:
+                return n
+            inwaiting=getattr(self.instr,"inWaiting",None)
+            return inwaiting() if inwaiting is not None else 0
         @reraise
         def _read_terms(self, terms=(), read_block_size=8, timeout=None, error_on_timeout=True):
-            result=b""
-            singlechar_terms=all(len(t)==1 for t in terms)
-            terms=[py3.as_builtin_bytes(t) for t in terms]
-            with self.single_op():
-                with self.using_timeout(timeout):
+            rxbuf=self._rxbuf
+            with self.using_timeout(timeout):
+                if not terms: # read everything until the timeout, accumulating directly into the persistent buffer
                     while True:
-                        c=self.instr.read(1 if terms else read_block_size)
-                        result=result+c
+                        c=self.instr.read(max(self._pending(),read_block_size))
                         if c==b"":
-                            if error_on_timeout and terms:
-                                raise self.Error("timeout during read")
+                            result=bytes(rxbuf)
+                            del rxbuf[:]
                             return result
-                        if singlechar_terms:
-                            if c in terms:
-                                return result
-                        else:
-                            for t in terms:
-                                if result.endswith(t):
-                                    return result
+                        rxbuf.extend(c)
+                scanner=self._compile_terms(terms)
+                maxlen=scanner[2]
+                spos=0 # rolling scan position, so the already-scanned part of the buffer is not re-examined
+                while True: # bulk-read into the buffer and scan for terminators, keeping the leftover for the next call
+                    end=_scan_terms(rxbuf,spos,scanner)
+                    if end>=0:
+                        result=bytes(rxbuf[:end])
+                        del rxbuf[:end]
+                        return result
+                    spos=max(len(rxbuf)-maxlen+1,0)
+                    c=self.instr.read(self._pending() or 1)
+                    if c==b"":
+                        if error_on_timeout:
+                            raise self.Error("timeout during read")
+                        result=bytes(rxbuf)
+                        del rxbuf[:]
+                        return result
+                    rxbuf.extend(c)
         @logerror
         def readline(self, remove_term=True, timeout=None, skip_empty=True, error_on_timeout=True):  # pylint: disable=arguments-differ
             """
@@ -903,7 +1203,7 @@ try:
                 result=self._read_terms(self.term_read or [],timeout=timeout,error_on_timeout=error_on_timeout)
                 self.cooldown("read")
                 if remove_term and self.term_read:
-                    result=remove_longest_term(result,self.term_read)
+                    result=self._remove_read_term(result)
                 if not (skip_empty and remove_term and (not result)):
                     break
             self._log("read",result)
@@ -920,7 +1220,10 @@ try:
                 if size is None:
                     result=self._read_terms(timeout=0,error_on_timeout=False)
                 else:
-                    result=self.instr.read(size=size)
+                    result=bytes(self._rxbuf[:size]) # serve the buffered leftover first
+                    del self._rxbuf[:size]
+                    if len(result)<size:
+                        result=result+self.instr.read(size=size-len(result))
                     if len(result)!=size:
                         raise self.Error("read returned less data than expected")
                 self.cooldown("read")
@@ -957,22 +1260,23 @@ try:
             self._log("write",data)
             with self.single_op():
                 data=py3.as_builtin_bytes(data)
-                if self.term_write:
-                    data=data+py3.as_builtin_bytes(self.term_write)
+                if self._term_write_bytes:
+                    data=data+self._term_write_bytes
                 self.instr.write(data)
                 self.cooldown("write")
                 if flush:
                     self.instr.flush()
                     self.cooldown("flush")
-                if read_echo_delay>0.:
-                    time.sleep(read_echo_delay)
                 if read_echo:
-                    for _ in range(read_echo_lines):
-                        self.readline()
+                    self._read_echo(read_echo_delay,read_echo_lines)
+                elif read_echo_delay>0.:
+                    time.sleep(read_echo_delay)
 
         @reraise
         def __repr__(self):
-            return "FT232DeviceBackend("+self.instr.__repr__()+")"
+            if self._repr_cached is None: # the underlying repr can be expensive to build; it only changes on reconnection
+                self._repr_cached="FT232DeviceBackend("+self.instr.__repr__()+")"
+            return self._repr_cached
 
         @staticmethod
         def _as_str(v):
@@ -1036,6 +1340,10 @@ class NetworkDeviceBackend(IDeviceCommBackend):
         conn=self._conn_to_dict(conn)
         self._split_addr(conn)
         super().__init__(conn,term_write=term_write,term_read=term_read,datatype=datatype,reraise_error=reraise_error)
+        self._rxbuf=bytearray()
+        self._recv_chunk=None
+        self._recv_chunk_view=None
+        self._repr_cached=None
         try:
             self.socket=None
             self.open()
@@ -1060,6 +1368,7 @@ class NetworkDeviceBackend(IDeviceCommBackend):
         self.close()
         self.socket=net.ClientSocket(send_method="fixedlen",recv_method="fixedlen")
         self.socket.connect(self.conn["addr"],self.conn["port"])
+        self._repr_cached=None
     @reraise
     def close(self):
         """Close the connection"""
@@ -1079,25 +1388,51 @@ class NetworkDeviceBackend(IDeviceCommBackend):
     def get_timeout(self):
         """Get operations timeout (in seconds)"""
         return self.socket.get_timeout()
-    
+
+    def _compile_terms(self, terms):
+        """Get the precompiled terminator scanner tuple (see :func:`_compile_terms`)"""
+        return _compile_terms(tuple(terms))
+    def _recv_terms(self, terms, timeout=None, chunk_l=1024):
+        """
+        Receive a single message ending with one of the given terminators.
+
+        Unlike a strict ``recv_delimiter`` call (which receives byte-by-byte to avoid overshooting),
+        receive in chunks and keep any data after the terminator in an internal buffer for the next call.
+        """
+        rxbuf=self._rxbuf
+        scanner=self._compile_terms(terms)
+        maxlen=scanner[2]
+        if self._recv_chunk is None or len(self._recv_chunk)<chunk_l:
+            self._recv_chunk=bytearray(chunk_l)
+            self._recv_chunk_view=memoryview(self._recv_chunk)
+        spos=0 # rolling scan position, so the already-scanned part of the buffer is not re-examined
+        with self.using_timeout(timeout):
+            while True:
+                end=_scan_terms(rxbuf,spos,scanner)
+                if end>=0:
+                    result=bytes(rxbuf[:end])
+                    del rxbuf[:end]
+                    return result
+                spos=max(len(rxbuf)-maxlen+1,0)
+                n=self.socket.recv_into(self._recv_chunk,chunk_l)
+                rxbuf.extend(self._recv_chunk_view[:n])
 
     @logerror
     @reraise
     def readline(self, remove_term=True, timeout=None, skip_empty=True):
         """
         Read a single line from the device.
-        
+
         Args:
             remove_term (bool): If ``True``, remove terminal characters from the result.
             timeout: Operation timeout. If ``None``, use the default device timeout.
             skip_empty (bool): If ``True``, ignore empty lines (works only for ``remove_term==True``).
         """
         while True:
-            with self.using_timeout(timeout):
-                result=self.socket.recv_delimiter(self.term_read,strict=True)
+            result=self._recv_terms(self.term_read,timeout=timeout)
             self.cooldown("read")
             if remove_term and self.term_read:
-                result=remove_longest_term(result,self.term_read)
+                result=self._remove_read_term(result)
             if not (skip_empty and remove_term and (not result)):
                 break
         self._log("read",result)
@@ -1107,13 +1442,18 @@ class NetworkDeviceBackend(IDeviceCommBackend):
     def read(self, size=None):
         """
         Read data from the device.
-        
+
         If `size` is not None, read `size` bytes (usual timeout applies); otherwise, read all available data (return immediately).
         """
         if size is None:
-            return self.socket.recv_all()
+            result=bytes(self._rxbuf)+py3.as_builtin_bytes(self.socket.recv_all())
+            del self._rxbuf[:]
+            return result
         else:
-            result=self.socket.recv_fixedlen(size)
+            result=bytes(self._rxbuf[:size]) # serve the buffered leftover first
+            del self._rxbuf[:size]
+            if len(result)<size:
+                result=result+py3.as_builtin_bytes(self.socket.recv_fixedlen(size-len(result)))
         self.cooldown("read")
         self._log("read",result)
         return self._to_datatype(result)
@@ -1122,7 +1462,7 @@ class NetworkDeviceBackend(IDeviceCommBackend):
     def read_multichar_term(self, term, remove_term=True, timeout=None):
         """
         Read a single line with multiple possible terminators.
-        
+
         Args:
             term: Either a string (single multi-char terminator) or a list of strings (multiple terminators).
             remove_term (bool): If ``True``, remove terminal characters from the result.
@@ -1130,8 +1470,7 @@ class NetworkDeviceBackend(IDeviceCommBackend):
         """
         if isinstance(term,py3.anystring):
             term=[term]
-        with self.socket.using_timeout(timeout):
-            result=self.socket.recv_delimiter(term,strict=True)
+        result=self._recv_terms(term,timeout=timeout)
         self.cooldown("read")
         if remove_term and term:
             result=remove_longest_term(result,term)
@@ -1147,22 +1486,178 @@ class NetworkDeviceBackend(IDeviceCommBackend):
         `flush` parameter is ignored.
         """
         self._log("write",data)
-        self.socket.send_delimiter(data,self.term_write)
+        self.socket.send_fixedlen(py3.as_builtin_bytes(data)+self._term_write_bytes)
         self.cooldown("write")
-        if read_echo_delay>0.:
-            time.sleep(read_echo_delay)
         if read_echo:
-            for _ in range(read_echo_lines):
-                self.readline()
+            self._read_echo(read_echo_delay,read_echo_lines)
+        elif read_echo_delay>0.:
+            time.sleep(read_echo_delay)
 
     @reraise
     def __repr__(self):
-        return "NetworkDeviceBackend("+self.socket.__repr__()+")"
-    
-    
+        if self._repr_cached is None: # only changes on reconnection
+            self._repr_cached="NetworkDeviceBackend("+self.socket.__repr__()+")"
+        return self._repr_cached
+
+
 _backends["network"]=NetworkDeviceBackend
 
 
+class AsyncNetworkDeviceBackend(NetworkDeviceBackend):
+    """
+    Network backend running the connection through an asyncio event loop in a background thread.
+
+    The public interface is synchronous and identical to :class:`NetworkDeviceBackend`,
+    but the socket is owned by the event loop, which keeps receiving into the stream buffer
+    even when no read call is in progress; this reduces the number of small ``recv`` calls on bursty traffic.
+
+    Connection parameters are the same as for :class:`NetworkDeviceBackend`.
+    """
+    _backend="network_async"
+    _recv_chunk_size=1024
+
+    def __init__(self, conn, timeout=10., term_write=None, term_read=None, datatype="auto", reraise_error=None):
+        self._loop=None
+        self._loop_thread=None
+        self._reader=None
+        self._writer=None
+        self._timeout_value=None
+        super().__init__(conn,timeout=timeout,term_write=term_write,term_read=term_read,datatype=datatype,reraise_error=reraise_error)
+
+    def _start_loop(self):
+        if self._loop is None:
+            self._loop=asyncio.new_event_loop()
+            self._loop_thread=threading.Thread(target=self._loop.run_forever,daemon=True)
+            self._loop_thread.start()
+    def _stop_loop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop.close()
+            self._loop=None
+            self._loop_thread=None
+    def _run(self, coro):
+        """Run a coroutine on the background loop and wait for its result"""
+        try:
+            return asyncio.run_coroutine_threadsafe(coro,self._loop).result()
+        except asyncio.TimeoutError:
+            raise self.Error("timeout during operation") from None
+        except asyncio.IncompleteReadError:
+            raise self.Error("connection closed while receiving") from None
+    @reraise
+    def open(self):
+        """Open the connection"""
+        self.close()
+        self._start_loop()
+        async def _connect():
+            return await asyncio.open_connection(self.conn["addr"],self.conn["port"])
+        self._reader,self._writer=self._run(_connect())
+    @reraise
+    def close(self):
+        """Close the connection"""
+        if self._writer is not None:
+            writer=self._writer
+            self._reader=self._writer=None
+            async def _close():
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except OSError:
+                    pass
+            self._run(_close())
+        self._stop_loop()
+    def is_opened(self):
+        return self._writer is not None
+
+    def set_timeout(self, timeout):
+        """Set operations timeout (in seconds)"""
+        if timeout is not None:
+            self._timeout_value=timeout
+    def get_timeout(self):
+        """Get operations timeout (in seconds)"""
+        return self._timeout_value
+
+    def _recv_terms(self, terms, timeout=None, chunk_l=None):
+        """Receive a single message ending with one of the given terminators (same buffering logic as the parent, with stream reads)"""
+        rxbuf=self._rxbuf
+        scanner=self._compile_terms(terms)
+        maxlen=scanner[2]
+        spos=0 # rolling scan position, so the already-scanned part of the buffer is not re-examined
+        to=self._timeout_value if timeout is None else timeout
+        async def _read_chunk():
+            return await asyncio.wait_for(self._reader.read(self._recv_chunk_size),to)
+        while True:
+            end=_scan_terms(rxbuf,spos,scanner)
+            if end>=0:
+                result=bytes(rxbuf[:end])
+                del rxbuf[:end]
+                return result
+            spos=max(len(rxbuf)-maxlen+1,0)
+            c=self._run(_read_chunk())
+            if not c:
+                raise self.Error("connection closed while receiving")
+            rxbuf.extend(c)
+    @logerror
+    @reraise
+    def read(self, size=None):
+        """
+        Read data from the device.
+
+        If `size` is not None, read `size` bytes (usual timeout applies); otherwise, read all available data (return immediately).
+        """
+        if size is None:
+            async def _drain():
+                chunks=[]
+                try:
+                    while True:
+                        c=await asyncio.wait_for(self._reader.read(self._recv_chunk_size),1E-3)
+                        if not c:
+                            break
+                        chunks.append(c)
+                except asyncio.TimeoutError:
+                    pass
+                return b"".join(chunks)
+            result=bytes(self._rxbuf)+self._run(_drain())
+            del self._rxbuf[:]
+            return result
+        result=bytes(self._rxbuf[:size]) # serve the buffered leftover first
+        del self._rxbuf[:size]
+        if len(result)<size:
+            async def _read_rest(n):
+                return await asyncio.wait_for(self._reader.readexactly(n),self._timeout_value)
+            result=result+self._run(_read_rest(size-len(result)))
+        self.cooldown("read")
+        self._log("read",result)
+        return self._to_datatype(result)
+    @logerror
+    @reraise
+    def write(self, data, flush=True, read_echo=False, read_echo_delay=0, read_echo_lines=1):
+        """
+        Write data to the device.
+
+        If ``read_echo==True``, wait for `read_echo_delay` seconds and then perform :func:`readline` (`read_echo_lines` times).
+        `flush` parameter is ignored.
+        """
+        self._log("write",data)
+        payload=py3.as_builtin_bytes(data)+self._term_write_bytes
+        async def _send():
+            self._writer.write(payload)
+            await self._writer.drain()
+        self._run(_send())
+        self.cooldown("write")
+        if read_echo:
+            self._read_echo(read_echo_delay,read_echo_lines)
+        elif read_echo_delay>0.:
+            time.sleep(read_echo_delay)
+
+    @reraise
+    def __repr__(self):
+        return "AsyncNetworkDeviceBackend({}:{})".format(self.conn["addr"],self.conn["port"])
+
+
+_backends["network_async"]=AsyncNetworkDeviceBackend
+
+
 
 
 try:
@@ -1211,7 +1706,13 @@ try:
                 term_read=[term_read]
             super().__init__(conn_dict.copy(),term_write=term_write,term_read=term_read,datatype=datatype,reraise_error=reraise_error)
             self.timeout=timeout
+            self._timeout_ms=None if timeout is None else int(timeout*1000)
             self.check_read_size=check_read_size
+            self._rxbuf=bytearray()
+            self._rd_buf=None # reusable receive buffer for chunked endpoint reads
+            self._rd_view=None
+            self._repr_cached=None
+            self._wr_buf=bytearray() # reusable write buffer for assembling payload and terminator
             try:
                 self.open()
             except self.BackendError as e:
@@ -1228,6 +1729,7 @@ try:
                 raise self.Error("can't find device with VID=0x{:04x} PID=0x{:04x} index {}; {} devices found".format(
                         self.conn["vendorID"],self.conn["productID"],idx,len(all_devs)))
             self.instr=all_devs[idx]
+            self._repr_cached=None
             self.ep_read=self.conn["endpoint_read"]
             self.ep_write=self.conn["endpoint_write"]
             self.cooldown("open")
@@ -1245,38 +1747,57 @@ try:
             """Set operations timeout (in seconds)"""
             if timeout is not None:
                 self.timeout=timeout
+                self._timeout_ms=int(timeout*1000) # cache the value in ms, which is what the endpoint calls take
         def get_timeout(self):
             """Get operations timeout (in seconds)"""
             return self.timeout
         def _timeout(self, timeout=None):
-            timeout=self.timeout if timeout is None else timeout
-            return None if timeout is None else int(timeout*1000)
+            if timeout is None:
+                return self._timeout_ms
+            return int(timeout*1000)
         
         
+        def _compile_terms(self, terms):
+            """Get the precompiled terminator scanner tuple (see :func:`_compile_terms`)"""
+            return _compile_terms(tuple(terms))
+        def _read_chunk(self, read_block_size, timeout):
+            """Read a single chunk (up to `read_block_size` bytes) into the reusable buffer; return the number of bytes read (0 on timeout)"""
+            if self._rd_buf is None or len(self._rd_buf)<read_block_size:
+                self._rd_buf=array.array("B",bytes(read_block_size))
+                self._rd_view=memoryview(self._rd_buf) # zero-copy view for transferring chunks into the receive buffer
+            try:
+                return self.instr.read(self.ep_read,self._rd_buf,timeout=self._timeout(timeout))
+            except self.BackendError:
+                return 0
         @reraise
         def _read_terms(self, terms=(), read_block_size=65536, timeout=None, error_on_timeout=True):
-            result=b""
-            singlechar_terms=all(len(t)==1 for t in terms)
-            terms=[py3.as_builtin_bytes(t) for t in terms]
-            while True:
-                try:
-                    c=self.instr.read(self.ep_read,1 if terms else read_block_size,timeout=self._timeout(timeout)).tobytes()
-                except self.BackendError:
-                    c=b""
-                result=result+c
-                if c==b"":
-                    if error_on_timeout and terms:
-                        raise self.Error("timeout during read")
+            rxbuf=self._rxbuf
+            if not terms: # read everything until the timeout, accumulating directly into the persistent buffer
+                while True:
+                    n=self._read_chunk(read_block_size,timeout)
+                    if not n:
+                        result=bytes(rxbuf)
+                        del rxbuf[:]
+                        return result
+                    rxbuf.extend(self._rd_view[:n])
+            scanner=self._compile_terms(terms)
+            maxlen=scanner[2]
+            spos=0 # rolling scan position, so the already-scanned part of the buffer is not re-examined
+            while True: # bulk-read into the buffer and scan for terminators, keeping the leftover for the next call
+                end=_scan_terms(rxbuf,spos,scanner)
+                if end>=0:
+                    result=bytes(rxbuf[:end])
+                    del rxbuf[:end]
                     return result
-                if not terms:
+                spos=max(len(rxbuf)-maxlen+1,0)
+                n=self._read_chunk(read_block_size,timeout)
+                if not n:
+                    if error_on_timeout:
+                        raise self.Error("timeout during read")
+                    result=bytes(rxbuf)
+                    del rxbuf[:]
                     return result
-                if singlechar_terms:
-                    if c in terms:
-                        return result
-                else:
-                    for t in terms:
-                        if result.endswith(t):
-                            return result
+                rxbuf.extend(self._rd_view[:n])
         @logerror
         def readline(self, remove_term=True, timeout=None, skip_empty=True, error_on_timeout=True):  # pylint: disable=arguments-differ
             """
@@ -1292,7 +1813,7 @@ try:
                 result=self._read_terms(self.term_read or [],timeout=timeout,error_on_timeout=error_on_timeout)
                 self.cooldown("read")
                 if remove_term and self.term_read:
-                    result=remove_longest_term(result,self.term_read)
+                    result=self._remove_read_term(result)
                 if not (skip_empty and remove_term and (not result)):
                     break
             self._log("read",result)
@@ -1308,7 +1829,10 @@ try:
             if size is None:
                 result=self._read_terms(read_block_size=max_read_size,timeout=1E-3,error_on_timeout=False)
             else:
-                result=self.instr.read(self.ep_read,size,timeout=self._timeout()).tobytes()
+                result=bytes(self._rxbuf[:size]) # serve the buffered leftover first
+                del self._rxbuf[:size]
+                if len(result)<size:
+                    result=result+self.instr.read(self.ep_read,size-len(result),timeout=self._timeout()).tobytes()
                 if len(result)!=size and self.check_read_size:
                     raise self.Error("read returned less than expected {} instead of {}".format(len(result),size))
             self.cooldown("read")
@@ -1344,19 +1868,22 @@ try:
             """
             self._log("write",data)
             data=py3.as_builtin_bytes(data)
-            if self.term_write:
-                data=data+py3.as_builtin_bytes(self.term_write)
+            if self._term_write_bytes: # assemble the payload in a reusable buffer instead of allocating the concatenation
+                wbuf=self._wr_buf
+                del wbuf[:]
+                wbuf+=data
+                wbuf+=self._term_write_bytes
+                data=wbuf
             self.instr.write(self.ep_write,data,timeout=self._timeout())
             self.cooldown("write")
             if read_echo:
-                if read_echo_delay>0.:
-                    time.sleep(read_echo_delay)
-                for _ in range(read_echo_lines):
-                    self.readline()
+                self._read_echo(read_echo_delay,read_echo_lines)
 
         @reraise
         def __repr__(self):
-            return "PyUSBDeviceBackend("+self.instr.__repr__()+")"
+            if self._repr_cached is None: # the pyusb device repr builds the whole descriptor dump; it only changes on reconnection
+                self._repr_cached="PyUSBDeviceBackend("+self.instr.__repr__()+")"
+            return self._repr_cached
 
         
         @staticmethod
@@ -1458,7 +1985,7 @@ try:
         
         @reraise
         def _read_terms(self, terms=(), read_block_size=8, timeout=None, error_on_timeout=True):
-            result=b""
+            result=bytearray()
             singlechar_terms=all(len(t)==1 for t in terms)
             terms=[py3.as_builtin_bytes(t) for t in terms]
             while True:
@@ -1466,20 +1993,20 @@ try:
                     c=self.instr.read(1 if terms else read_block_size,timeout=timeout)
                 except self.BackendError:
                     c=b""
-                result=result+c
                 if c==b"":
                     if error_on_timeout and terms:
                         raise self.Error("timeout during read")
-                    return result
+                    return bytes(result)
+                result.extend(c)
                 if not terms:
-                    return result
+                    return bytes(result)
                 if singlechar_terms:
                     if c in terms:
-                        return result
+                        return bytes(result)
                 else:
                     for t in terms:
                         if result.endswith(t):
-                            return result
+                            return bytes(result)
         @logerror
         def readline(self, remove_term=True, timeout=None, skip_empty=True, error_on_timeout=True):  # pylint: disable=arguments-differ
             """
@@ -1495,7 +2022,7 @@ try:
                 result=self._read_terms(self.term_read or [],timeout=timeout,error_on_timeout=error_on_timeout)
                 self.cooldown("read")
                 if remove_term and self.term_read:
-                    result=remove_longest_term(result,self.term_read)
+                    result=self._remove_read_term(result)
                 if not (skip_empty and remove_term and (not result)):
                     break
             self._log("read",result)
@@ -1549,15 +2076,12 @@ try:
             """
             self._log("write",data)
             data=py3.as_builtin_bytes(data)
-            if self.term_write:
-                data=data+py3.as_builtin_bytes(self.term_write)
+            if self._term_write_bytes:
+                data=data+self._term_write_bytes
             self.instr.write(data)
             self.cooldown("write")
             if read_echo:
-                if read_echo_delay>0.:
-                    time.sleep(read_echo_delay)
-                for _ in range(read_echo_lines):
-                    self.readline()
+                self._read_echo(read_echo_delay,read_echo_lines)
 
         @reraise
         def __repr__(self):
@@ -1568,8 +2092,10 @@ try:
         def list_resources(desc=False, **kwargs):
             try:
                 devs=list(hid.list_devices(**kwargs))
-            except PyUSBDeviceBackend.BackendError as e:
-                raise PyUSBDeviceBackend.Error from e
+            except HIDeviceBackend.BackendError as e:
+                raise HIDeviceBackend.Error(e) from e
+            except AttributeError as e: # the underlying DLLs are only available on Windows
+                raise HIDeviceBackend.Error(e) from e
             if desc:
                 return devs
             return [d.path for d in devs]
@@ -1701,10 +2227,12 @@ _backends["recorded"]=RecordedDeviceBackend
     
 _serial_re=re.compile(r"^(com\d+|/?(dev/)?tty.*)",re.IGNORECASE)
 def _is_serial_addr(addr):
-    return isinstance(addr,py3.anystring) and bool(_serial_re.match(addr))
+    # a serial address starts with "com", "/", "dev" or "tty"; check the first character before running the regex
+    return isinstance(addr,py3.anystring) and addr[:1] in ("c","C","/","d","D","t","T") and bool(_serial_re.match(addr))
 _network_re=re.compile(r"(\d+\.){3}\d+(:\d+)?",re.IGNORECASE)
 def _is_network_addr(addr):
-    return isinstance(addr,py3.anystring) and bool(_network_re.match(addr))
+    # a network address starts with a digit; check it before running the regex
+    return isinstance(addr,py3.anystring) and addr[:1].isdigit() and bool(_network_re.match(addr))
 _visa_re=re.compile(r"\w+(::\w+)+",re.IGNORECASE)
 def _is_visa_addr(addr):
     return isinstance(addr,py3.anystring) and bool(_visa_re.match(addr))
@@ -1729,13 +2257,19 @@ def autodetect_backend(conn, default="visa"):
         if "vendorID" in conn and "productID" in conn:
             return "pyusb"
         return default
-    if _is_network_addr(conn):
+    if isinstance(conn,py3.anystring):
+        return _autodetect_backend_addr(conn,default)
+    return default
+@functools.lru_cache(maxsize=128)
+def _autodetect_backend_addr(addr, default):
+    """Determine the backend by a string address (memoized, since the same address is typically resolved repeatedly)"""
+    if _is_network_addr(addr):
         return "network"
-    if _is_serial_addr(conn):
+    if _is_serial_addr(addr):
         return "serial"
-    if _is_visa_addr(conn):
+    if _is_visa_addr(addr):
         return "visa"
-    if _is_hid_addr(conn):
+    if _is_hid_addr(addr):
         return "hid"
     return default
 def _as_backend(backend, conn=None):
@@ -1786,12 +2320,21 @@ def list_backend_resources(backend=None, desc=False):
     """
     List all resources for the given backend.
 
-    If `backend` is ``None``, return dictionary ``{backend: resources}`` for all available backends.
+    If `backend` is ``None``, return dictionary ``{backend: resources}`` for all available backends;
+    in this case the backends are queried in parallel threads (some scans take noticeable time),
+    and backends whose enumeration raises an error are omitted from the result.
     If ``desc==False``, return list of connections (usually strings or tuples), which can be used to connect to the device.
     Otherwise, return a list of descriptions, which have more info, but can be backend-dependent.
     """
     if backend is None:
-        res={n:b.list_resources(desc=desc) for (n,b) in _backends.items()}
+        names=list(_backends)
+        def _list(name):
+            try:
+                return _backends[name].list_resources(desc=desc)
+            except DeviceBackendError:
+                return None
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(names)) as executor:
+            res=dict(zip(names,executor.map(_list,names)))
         return {n:r for n,r in res.items() if r is not None}
     else:
         return _as_backend(backend).list_resources(desc=desc)
@@ -195,6 +195,25 @@ class ClientSocket:
         sock_func=lambda: self.sock.send(py3.as_builtin_bytes(msg))
         return _wait_sock_func(sock_func,self.timeout,self.wait_callback)
     
+    def recv_into(self, buffer, l=None):
+        """
+        Receive data into the supplied writable buffer (e.g., a ``bytearray`` or a ``memoryview``).
+
+        If `l` is not ``None``, receive at most `l` bytes; otherwise, receive up to the buffer length.
+        Return the number of bytes received (at least one); unlike :meth:`recv_fixedlen`, no intermediate bytes object is allocated.
+        """
+        if l is not None:
+            buffer=memoryview(buffer)[:l]
+        sock_func=lambda: self.sock.recv_into(buffer)
+        try:
+            nrecvd=_wait_sock_func(sock_func,self.timeout,self.wait_callback)
+        except socket.timeout:
+            raise SocketTimeout("timeout while receiving")
+        except ConnectionResetError:
+            raise SocketError("connection closed while receiving")
+        if nrecvd==0:
+            raise SocketError("connection closed while receiving")
+        return nrecvd
     def recv_fixedlen(self, l):
         """Receive fixed-length message of length `l`"""
         chunks=[]
@@ -2,6 +2,11 @@ from ...core.devio import SCPI, interface
 from ...core.utils import py3
 from .base import ThorlabsError, ThorlabsBackendError
 
+import contextlib
+import queue
+import re
+import threading
+
 
 
 class ThorlabsSerialInterface(SCPI.SCPIDevice):
@@ -18,36 +23,163 @@ class ThorlabsSerialInterface(SCPI.SCPIDevice):
     _default_failsafe=True
     _default_retry_delay=0.5
     def __init__(self, conn):
+        self._write_batch_level=0
+        self._echo_queue=[]
+        self._rx_dirty=True
+        self._rx_line=bytearray(256) # persistent line buffer, so reading a reply does not allocate intermediate bytes objects
+        self._rx_line_view=memoryview(self._rx_line)
         super().__init__(conn,backend="serial",term_read=["\r","\n"],term_write="\r",timeout=5.,backend_defaults={"serial":("COM1",115200)})
         self.open()
 
     def open(self):
         super().open()
+        serial_port=getattr(self.instr,"instr",None)
+        if hasattr(serial_port,"set_buffer_size"): # Windows-only pyserial call; enlarge the default 4kB driver RX buffer to accommodate bursts of batched replies
+            try:
+                serial_port.set_buffer_size(rx_size=65536,tx_size=65536)
+            except (self.instr.BackendError,OSError):
+                pass
         self.instr.flush_read()
-    
+        self._rx_dirty=False
+
     def _check_reply(self, reply, msg=None):
         return reply.find(b"CMD_")<0 and reply.find(b"Error")<0
+    def ask_bounded(self, msg, max_bytes, data_type="int"):
+        """
+        Query a command whose reply payload is known to fit within `max_bytes` bytes.
+
+        A streamlined version of :meth:`ask` for short numeric replies: the reply is received
+        into the persistent line buffer and converted in place, skipping the generic retry and
+        message-parsing machinery. `data_type` can be ``"int"`` or ``"float"``.
+        An oversized reply or any communication or conversion failure falls back to the standard :meth:`ask`.
+        """
+        conv=int if data_type=="int" else float
+        try:
+            with self.instr.single_op():
+                self._instr_write(msg)
+                data=self._instr_read()
+            if len(data)>max_bytes:
+                raise ValueError("reply length {} exceeds the expected bound {}".format(len(data),max_bytes))
+            return conv(data)
+        except (self.Error,ValueError):
+            self._rx_dirty=True # the reply stream might be out of sync; re-sync through the standard path
+            return self.ask(msg,data_type)
+    _settings_table=() # class-level rows of (name, getter_name, setter_name) installed in bulk by _install_settings_table
+    def _install_settings_table(self):
+        """
+        Register all device variables described by the class-level ``_settings_table``.
+
+        Each row is ``(name, getter_name, setter_name)`` with method names resolved on the instance;
+        a ``None`` setter name adds an info variable instead of a settings variable.
+        Keeping the table at class scope avoids rebuilding the descriptor arguments on every instance creation.
+        """
+        for name,getter,setter in self._settings_table:
+            getter=getattr(self,getter) if getter is not None else None
+            if setter is None:
+                self._add_info_variable(name,getter)
+            else:
+                self._add_settings_variable(name,getter,getattr(self,setter))
+    @contextlib.contextmanager
+    def _write_batch(self):
+        """
+        Context manager for batching several consecutive write commands.
+
+        Inside the ``with`` block, write commands are sent without waiting for the command echo;
+        the queued echoes are consumed (and, if applicable, validated) in bulk at the end of the block,
+        so a sequence of writes costs a single round-trip instead of one per command.
+        """
+        self._write_batch_level+=1
+        try:
+            yield
+        finally:
+            self._write_batch_level-=1
+            if not self._write_batch_level:
+                self._drain_echo()
+    def _check_echo(self, msg):
+        res=self._instr_read()
+        if res.strip()!=py3.as_bytes(msg.strip()):
+            self._rx_dirty=True # the reply stream is out of sync with the commands
+            raise self.Error("request {} returned unexpected echo: {}".format(py3.as_bytes(msg.strip()),res))
+    def _drain_echo(self):
+        """Consume echoes of all queued batched writes (validating them if echo validation is enabled)"""
+        if not self._echo_queue:
+            return
+        queue,self._echo_queue=self._echo_queue,[]
+        for msg in queue:
+            if self._validate_echo:
+                self._check_echo(msg)
+            else:
+                try:
+                    self._instr_read()
+                except self.Error:
+                    pass
     def _instr_write(self, msg):
-        self.instr.flush_read()
+        if self._write_batch_level:
+            self.instr.write(msg)
+            self._echo_queue.append(msg)
+            return
+        self._drain_echo()
+        if self._rx_dirty: # flush_read costs a driver round-trip, so only flush when residual data could be present
+            self.instr.flush_read()
+            self._rx_dirty=False
         if self._validate_echo:
             self.instr.write(msg)
-            res=self._instr_read()
-            if res.strip()==py3.as_bytes(msg.strip()):
-                return
-            raise self.Error("request {} returned unexpected echo: {}".format(py3.as_bytes(msg.strip()),res))
+            self._check_echo(msg)
+            return
         self.instr.write(msg,read_echo=True)
+    _allow_multiwrite=False # whether the device firmware accepts several commands concatenated in a single write frame
+    def _instr_write_multi(self, msgs):
+        """
+        Send several commands in a single write frame.
+
+        The commands are joined with the write terminator and sent in one backend write call,
+        after which the echoes are consumed (and, if applicable, validated) in bulk.
+        Only usable on devices with ``_allow_multiwrite`` enabled; others should fall back to :meth:`_write_batch`.
+        """
+        self._drain_echo()
+        if self._rx_dirty:
+            self.instr.flush_read()
+            self._rx_dirty=False
+        msgs=[py3.as_bytes(m) for m in msgs]
+        term=py3.as_bytes(self.instr.term_write)
+        self.instr.write(term.join(msgs)) # the backend appends the final terminator
+        self._echo_queue.extend(msgs)
+        self._drain_echo()
+    _prompt_chars=b"> \t\r\n" # characters which can precede the reply body
+    _ws_chars=b" \t\r\n" # characters which can trail the reply body
     def _instr_read(self, raw=False, size=None):
-        if size:
-            data=self.instr.read(size=size)
-        elif raw:
-            data=self.instr.readline(remove_term=False)
-        else:
-            data=""
-            while not data:
-                data=self.instr.readline(remove_term=True).strip()
-                while data[:1]==b">":
-                    data=data[1:].strip()
-        return data
+        if self._echo_queue:
+            self._drain_echo()
+        try:
+            if size:
+                return self.instr.read(size=size)
+            if raw:
+                return self.instr.readline(remove_term=False)
+            line=self._rx_line
+            with self.instr.single_op(): # consume lines from the backend receive buffer under a single operation
+                while True:
+                    try:
+                        n=self.instr.readline_into(line)
+                    except ValueError: # line longer than the persistent buffer; it is pushed back by the backend, so re-read it through the allocating path
+                        data=self.instr.readline(remove_term=True).lstrip(self._prompt_chars).strip()
+                        if len(data)>len(self._rx_line): # grow the persistent buffer, so similar replies take the fast path next time
+                            self._rx_line=bytearray(len(data)*2)
+                            self._rx_line_view=memoryview(self._rx_line)
+                            line=self._rx_line
+                        if data:
+                            return data
+                        continue
+                    # trim prompt characters and whitespace by adjusting offsets instead of reallocating per strip
+                    start,end=0,n
+                    while start<end and line[start] in self._prompt_chars:
+                        start+=1
+                    while end>start and line[end-1] in self._ws_chars:
+                        end-=1
+                    if end>start:
+                        return bytes(self._rx_line_view[start:end])
+        except self.Error:
+            self._rx_dirty=True # a failed read can leave a partial reply in the buffer
+            raise
 
 
 class FW(ThorlabsSerialInterface):
@@ -59,24 +191,39 @@ class FW(ThorlabsSerialInterface):
         respect_bound(bool): if ``True``, avoid crossing the boundary between the first and the last position in the wheel
     """
     _validate_echo=True
+    _allow_multiwrite=True # FW firmware consumes the input as a stream, so concatenated commands are accepted
+    _settings_table=(("pos","get_position","set_position"),
+                    ("pcount","get_pcount","set_pcount"),
+                    ("speed_mode","get_speed_mode","set_speed_mode"),
+                    ("trigger_mode","get_trigger_mode","set_trigger_mode"),
+                    ("sensors_mode","get_sensor_mode","set_sensor_mode"))
     def __init__(self, conn, respect_bound=True):
         super().__init__(conn)
-        self._add_settings_variable("pos",self.get_position,self.set_position)
-        self._add_settings_variable("pcount",self.get_pcount,self.set_pcount)
-        self._add_settings_variable("speed_mode",self.get_speed_mode,self.set_speed_mode)
-        self._add_settings_variable("trigger_mode",self.get_trigger_mode,self.set_trigger_mode)
-        self._add_settings_variable("sensors_mode",self.get_sensor_mode,self.set_sensor_mode)
+        self._install_settings_table()
         with self._close_on_error():
             self.pcount=self.get_pcount()
         self.respect_bound=respect_bound
 
     _id_comm="*idn?"
+    # precomputed command bytes; bytes %-formatting is a C-level fast path, unlike per-call str.format
+    _pos_query=b"pos?"
+    _pos_comm=b"pos=%d"
+    _pcount_query=b"pcount?"
+    _pcount_comm=b"pcount=%d"
+    _speed_query=b"speed?"
+    _speed_comm=b"speed=%d"
+    _trig_query=b"trig?"
+    _trig_comm=b"trig=%d"
+    _sensors_query=b"sensors?"
+    _sensors_comm=b"sensors=%d"
     def ask(self, msg, data_type="string", delay=0., timeout=None, read_echo=False):
-        self.flush()
+        if self._rx_dirty: # when the reply stream is in sync, skip the flush, which costs at least one timeout-bounded read
+            self.flush()
+            self._rx_dirty=False
         return super().ask(msg,data_type=data_type,delay=delay,timeout=timeout,read_echo=read_echo)
     def get_position(self):
         """Get the wheel position (starting from 1)"""
-        return self.ask("pos?","int")
+        return self.ask_bounded(self._pos_query,3)
     def set_position(self, pos):
         """Set the wheel position (starting from 1)"""
         if self.respect_bound: # check if the wheel could go through zero; if so, manually go around instead
@@ -84,55 +231,65 @@ class FW(ThorlabsSerialInterface):
             if abs(pos-cur_pos)>=self.pcount//2: # could switch by going through zero
                 medp1=(2*cur_pos+pos)//3
                 medp2=(cur_pos+2*pos)//3
-                self.write("pos={}".format(medp1))
-                self.write("pos={}".format(medp2))
-                self.write("pos={}".format(pos))
+                pos_comm=self._pos_comm
+                comms=[pos_comm%medp1,pos_comm%medp2,pos_comm%pos]
+                if self._allow_multiwrite: # one concatenated frame, one echo drain
+                    self._instr_write_multi(comms)
+                else:
+                    with self._write_batch(): # send the three commands back-to-back and consume the echoes at the end
+                        for comm in comms:
+                            self.write(comm)
             else:
-                self.write("pos={}".format(pos))
+                self.write(self._pos_comm%pos)
         else:
-            self.write("pos={}".format(pos))
+            self.write(self._pos_comm%pos)
         return self.get_position()
 
     def get_pcount(self):
         """Get the number of wheel positions (6 or 12)"""
-        return self.ask("pcount?","int")
+        return self.ask_bounded(self._pcount_query,2)
     def set_pcount(self, pcount):
         """Set the number of wheel positions (6 or 12)"""
-        self.write("pcount={}".format(pcount))
+        self.write(self._pcount_comm%pcount)
+        self.pcount=pcount # trust the just-sent value instead of paying a confirmation round-trip; use refresh_pcount to re-sync
+        return self.pcount
+    def refresh_pcount(self):
+        """Re-read the number of wheel positions from the device"""
         self.pcount=self.get_pcount()
         return self.pcount
 
+    # direct reverse lookup tables for the polled getters; the setters keep the full parameter machinery for validation
+    _speed_modes_rev={0:"low",1:"high"}
+    _trigger_modes_rev={0:"in",1:"out"}
+    _sensor_modes_rev={0:"off",1:"on"}
     _p_speed_mode=interface.EnumParameterClass("speed_mode",{"low":0,"high":1})
-    @interface.use_parameters(_returns="speed_mode")
     def get_speed_mode(self):
         """Get the motion speed mode (``"low"`` or ``"high"``)"""
-        return self.ask("speed?","int")
+        return self._speed_modes_rev[self.ask(self._speed_query,"int")]
     @interface.use_parameters
     def set_speed_mode(self, speed_mode):
         """Set the motion speed mode (``"low"`` or ``"high"``)"""
-        self.write("speed={}".format(speed_mode))
+        self.write(self._speed_comm%speed_mode)
         return self.get_speed_mode()
 
     _p_trigger_mode=interface.EnumParameterClass("trigger_mode",{"in":0,"out":1})
-    @interface.use_parameters(_returns="trigger_mode")
     def get_trigger_mode(self):
         """Get the trigger mode (``"in"`` to input external trigger, ``"out"`` to output trigger)"""
-        return self.ask("trig?","int")
+        return self._trigger_modes_rev[self.ask(self._trig_query,"int")]
     @interface.use_parameters
     def set_trigger_mode(self, trigger_mode):
         """Set the trigger mode (``"in"`` to input external trigger, ``"out"`` to output trigger)"""
-        self.write("trig={}".format(trigger_mode))
+        self.write(self._trig_comm%trigger_mode)
         return self.get_trigger_mode()
 
     _p_sensor_mode=interface.EnumParameterClass("sensor_mode",{"off":0,"on":1})
-    @interface.use_parameters(_returns="sensor_mode")
     def get_sensor_mode(self):
         """Get the sensor mode (``"off"`` to turn off when idle to eliminate stray light, ``"on"`` to remain on)"""
-        return self.ask("sensors?","int")
+        return self._sensor_modes_rev[self.ask(self._sensors_query,"int")]
     @interface.use_parameters
     def set_sensor_mode(self, sensor_mode):
         """Set the sensor mode (``"off"`` to turn off when idle to eliminate stray light, ``"on"`` to remain on)"""
-        self.write("sensors={}".format(sensor_mode))
+        self.write(self._sensors_comm%sensor_mode)
         return self.get_sensor_mode()
 
     def store_settings(self):
@@ -150,12 +307,13 @@ class FWv1(ThorlabsSerialInterface):
         respect_bound(bool): if ``True``, avoid crossing the boundary between the first and the last position in the wheel
     """
     _validate_echo=True
+    _settings_table=(("pos","get_position","set_position"),
+                    ("pcount","get_pcount",None),
+                    ("trigger_mode","get_trigger_mode","set_trigger_mode"))
     def __init__(self, conn, pcount=6, respect_bound=True):
         super().__init__(conn)
         self.pcount=pcount
-        self._add_settings_variable("pos",self.get_position,self.set_position)
-        self._add_info_variable("pcount",self.get_pcount)
-        self._add_settings_variable("trigger_mode",self.get_trigger_mode,self.set_trigger_mode)
+        self._install_settings_table()
         self.respect_bound=respect_bound
 
     def _instr_write(self, msg):
@@ -169,7 +327,9 @@ class FWv1(ThorlabsSerialInterface):
 
     _id_comm="*idn?"
     def ask(self, msg, data_type="string", delay=0., timeout=None, read_echo=False):
-        self.flush()
+        if self._rx_dirty: # when the reply stream is in sync, skip the flush, which costs at least one timeout-bounded read
+            self.flush()
+            self._rx_dirty=False
         return super().ask(msg,data_type=data_type,delay=delay,timeout=timeout,read_echo=read_echo)
     def get_position(self):
         """Get the wheel position (starting from 1)"""
@@ -221,28 +381,105 @@ class MDT69xA(ThorlabsSerialInterface):
         conn: serial connection parameters (usually port or a tuple containing port and baudrate)
     """
     def __init__(self, conn):
+        self._async_queue=None
+        self._async_thread=None
+        self._async_error=None
         super().__init__(conn)
-        self._add_settings_variable("voltage",self.get_voltage,self.set_voltage,mux=("xyz",1))
+        self._voltage_range=None
+        self._add_settings_variable("voltage",self.get_all_voltages,self._set_all_voltages)
         self._add_status_variable("voltage_range",self.get_voltage_range)
         with self._close_on_error():
             self.get_id(timeout=2.)
 
     _id_comm="I"
     _p_channel=interface.EnumParameterClass("channel",["x","y","z"])
+    _volt_re=re.compile(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?") # numeric body of the bracketed voltage reply
+    def _parse_voltage(self, resp):
+        m=self._volt_re.search(resp)
+        if m is None:
+            raise self.Error("could not parse voltage reply: {}".format(resp))
+        return float(m.group(0))
+    # per-channel command bytes built once at class definition, instead of str.upper plus concatenation and formatting per call
+    _chan_r_query={"x":b"XR?","y":b"YR?","z":b"ZR?"}
+    _chan_v_comm={"x":b"XV%.3f","y":b"YV%.3f","z":b"ZV%.3f"}
     @interface.use_parameters
     def get_voltage(self, channel="x"):
         """Get the output voltage in Volts at a given channel"""
-        resp=self.ask(channel.upper()+"R?")
-        resp=resp.strip()[2:-1].strip()
-        return float(resp)
+        return self._parse_voltage(self.ask(self._chan_r_query[channel]))
     @interface.use_parameters
     def set_voltage(self, voltage, channel="x"):
         """Set the output voltage in Volts at a given channel"""
-        self.write(channel.upper()+"V{:.3f}".format(voltage))
+        self.write(self._chan_v_comm[channel]%voltage)
         return self._wip.get_voltage(channel=channel)
+    def _async_worker(self):
+        while True:
+            item=self._async_queue.get()
+            if item is None:
+                return
+            if isinstance(item,threading.Event): # synchronization barrier; all previously queued commands are already sent
+                item.set()
+                continue
+            channel,voltage=item
+            try:
+                self.write(self._chan_v_comm[channel]%voltage)
+            except Exception as e:  # pylint: disable=broad-except
+                self._async_error=e # record any error and keep draining, so the queue never stalls and the error surfaces on the next sync
+    @interface.use_parameters
+    def set_voltage_async(self, voltage, channel="x"):
+        """
+        Set the output voltage in Volts at a given channel without waiting for completion.
+
+        The command is placed on a bounded queue consumed in order by a background thread,
+        so the call returns as soon as the command is queued; unlike :meth:`set_voltage`,
+        no verification read is performed. Use :meth:`sync_voltage_async` to wait until
+        all queued commands have been sent (required before any synchronous communication).
+        """
+        if self._async_thread is None:
+            self._async_queue=queue.Queue(maxsize=64)
+            self._async_thread=threading.Thread(target=self._async_worker,daemon=True)
+            self._async_thread.start()
+        self._async_queue.put((channel,voltage))
+    def sync_voltage_async(self, timeout=None):
+        """Wait until all commands queued by :meth:`set_voltage_async` have been sent, and raise the error if any of them failed"""
+        if self._async_thread is not None:
+            barrier=threading.Event()
+            self._async_queue.put(barrier)
+            if not barrier.wait(timeout):
+                raise self.Error("timeout waiting for the asynchronous voltage queue to drain")
+        if self._async_error is not None:
+            error,self._async_error=self._async_error,None
+            raise error
+    def close(self):
+        if self._async_thread is not None:
+            self._async_queue.put(None)
+            self._async_thread.join()
+            self._async_thread=None
+            self._async_queue=None
+        super().close()
+
+    _all_volt_query=b"XR?YR?ZR?"
+    def get_all_voltages(self):
+        """
+        Get the output voltages in Volts at all three channels.
+
+        Return a list ``[x, y, z]``. The three queries are sent as a single concatenated
+        command frame, so the call costs one round-trip instead of three.
+        """
+        with self.instr.single_op():
+            resps=[self._ask_retry(self._all_volt_query)]
+            resps+=[self._read_retry() for _ in range(2)]
+        return [self._parse_voltage(py3.as_str(r)) for r in resps]
+    def _set_all_voltages(self, voltages):
+        for ch,v in zip("xyz",voltages):
+            self.set_voltage(v,channel=ch)
+
+    def get_voltage_range(self, refresh=False):
+        """
+        Get the selected voltage range in Volts (75, 100 or 150).
 
-    def get_voltage_range(self):
-        """Get the selected voltage range in Volts (75, 100 or 150)"""
-        resp=self.ask("%")
-        resp=resp.strip()[2:-1].strip()
-        return float(resp)
\ No newline at end of file
+        The range is selected by a physical switch, so it is queried once and cached;
+        if ``refresh==True``, query the device again.
+        """
+        if refresh or self._voltage_range is None:
+            self._voltage_range=self._parse_voltage(self.ask("%"))
+        return self._voltage_range
\ No newline at end of file